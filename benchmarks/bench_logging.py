@@ -0,0 +1,42 @@
+"""Benchmark de vazão de logs através do OtelLogger."""
+
+import logging
+from functools import cache
+
+import pyperf
+from opentelemetry.sdk._logs.export import InMemoryLogRecordExporter
+
+from microsservice_telemetry_toolkit import OtelLogger
+
+from common import SERVICE_NAME
+
+
+@cache
+def log_exporter() -> InMemoryLogRecordExporter:
+    exporter = InMemoryLogRecordExporter()
+    OtelLogger.configure_global_logging(
+        service_name=SERVICE_NAME,
+        service_environment="benchmark",
+        log_exporter=exporter,
+    )
+    return exporter
+
+
+def bench_log_info(loops: int) -> float:
+    exporter = log_exporter()
+    logger = logging.getLogger("benchmark")
+    range_it = range(loops)
+    t0 = pyperf.perf_counter()
+    for i in range_it:
+        logger.info("processed order %s", i)
+    elapsed = pyperf.perf_counter() - t0
+    exporter.clear()
+    return elapsed
+
+
+def add_benchmarks(runner: pyperf.Runner) -> None:
+    runner.bench_time_func("logger_info", bench_log_info)
+
+
+if __name__ == "__main__":
+    add_benchmarks(pyperf.Runner())
@@ -0,0 +1,47 @@
+"""Benchmarks de registro em counter e histogram por cardinalidade de atributos."""
+
+import pyperf
+
+from common import tracer
+
+CARDINALITIES = (1, 10, 100, 1000)
+
+
+def _attribute_sets(cardinality: int) -> list[dict[str, str]]:
+    return [
+        {"http.route": f"/route/{i}", "http.method": "GET", "status": "200"}
+        for i in range(cardinality)
+    ]
+
+
+def _bench_instrument(loops: int, record, attribute_sets) -> float:
+    count = len(attribute_sets)
+    range_it = range(loops)
+    t0 = pyperf.perf_counter()
+    for i in range_it:
+        record(1, attributes=attribute_sets[i % count])
+    return pyperf.perf_counter() - t0
+
+
+def add_benchmarks(runner: pyperf.Runner) -> None:
+    app_tracer = tracer()
+    counter = app_tracer.create_counter("bench.requests", "requests")
+    histogram = app_tracer.create_histogram("bench.duration", "ms")
+    for cardinality in CARDINALITIES:
+        attribute_sets = _attribute_sets(cardinality)
+        runner.bench_time_func(
+            f"counter_add_cardinality_{cardinality}",
+            _bench_instrument,
+            counter.add,
+            attribute_sets,
+        )
+        runner.bench_time_func(
+            f"histogram_record_cardinality_{cardinality}",
+            _bench_instrument,
+            histogram.record,
+            attribute_sets,
+        )
+
+
+if __name__ == "__main__":
+    add_benchmarks(pyperf.Runner())
@@ -0,0 +1,54 @@
+"""Benchmark de OtelSpan.set_attributes.
+
+Compara a definição de atributos chave a chave, em lote via dict e em lote via
+SpanAttributes pré-validado.
+"""
+
+import pyperf
+
+from microsservice_telemetry_toolkit import OtelSpan, SpanAttributes
+
+from common import sdk_tracer, time_loops
+
+ATTRIBUTES_COUNT = 30
+
+ATTRIBUTES = {f"http.request.attr_{i}": f"value-{i}" for i in range(ATTRIBUTES_COUNT)}
+FROZEN_ATTRIBUTES = SpanAttributes.create(ATTRIBUTES)
+
+
+def _set_one_by_one(span: OtelSpan) -> None:
+    for key, value in ATTRIBUTES.items():
+        span.set_attribute(key, value)
+
+
+def _run(loops: int, apply) -> float:
+    tracer = sdk_tracer()
+
+    def operation() -> None:
+        span = tracer.start_span("bench.span.attributes")
+        apply(OtelSpan("bench.span.attributes", span))
+        span.end()
+
+    return time_loops(loops, operation)
+
+
+def bench_set_attribute_loop(loops: int) -> float:
+    return _run(loops, _set_one_by_one)
+
+
+def bench_set_attributes_dict(loops: int) -> float:
+    return _run(loops, lambda span: span.set_attributes(ATTRIBUTES))
+
+
+def bench_set_attributes_frozen(loops: int) -> float:
+    return _run(loops, lambda span: span.set_attributes(FROZEN_ATTRIBUTES))
+
+
+def add_benchmarks(runner: pyperf.Runner) -> None:
+    runner.bench_time_func("span_set_attribute_loop", bench_set_attribute_loop)
+    runner.bench_time_func("span_set_attributes_dict", bench_set_attributes_dict)
+    runner.bench_time_func("span_set_attributes_frozen", bench_set_attributes_frozen)
+
+
+if __name__ == "__main__":
+    add_benchmarks(pyperf.Runner())
@@ -0,0 +1,34 @@
+"""Benchmarks de conversão de ids e de OtelSpan.get_context."""
+
+import pyperf
+
+from microsservice_telemetry_toolkit import OtelSpan
+
+from common import sdk_tracer, span_exporter, tracer
+
+TRACE_ID = "4bf92f3577b34da6a3ce929d0e0e4736"
+SPAN_ID = "00f067aa0ba902b7"
+
+
+def bench_get_context(loops: int) -> float:
+    span = sdk_tracer().start_span("bench.span.context")
+    otel_span = OtelSpan("bench.span.context", span)
+    range_it = range(loops)
+    t0 = pyperf.perf_counter()
+    for _ in range_it:
+        otel_span.get_context()
+    elapsed = pyperf.perf_counter() - t0
+    span.end()
+    span_exporter().clear()
+    return elapsed
+
+
+def add_benchmarks(runner: pyperf.Runner) -> None:
+    app_tracer = tracer()
+    runner.bench_func("tracer_cast_trace_id", app_tracer._cast_trace_id, TRACE_ID)
+    runner.bench_func("tracer_cast_span_id", app_tracer._cast_span_id, SPAN_ID)
+    runner.bench_time_func("span_get_context", bench_get_context)
+
+
+if __name__ == "__main__":
+    add_benchmarks(pyperf.Runner())
@@ -0,0 +1,20 @@
+"""Benchmarks de SpanNameValidator.validate."""
+
+import pyperf
+
+from microsservice_telemetry_toolkit.application import SpanNameValidator
+
+
+def add_benchmarks(runner: pyperf.Runner) -> None:
+    root_validator = SpanNameValidator(parts_count=3)
+    action_validator = SpanNameValidator(parts_count=1)
+    runner.bench_func(
+        "span_name_validator_root",
+        root_validator.validate,
+        "service.domain.operation",
+    )
+    runner.bench_func("span_name_validator_action", action_validator.validate, "save")
+
+
+if __name__ == "__main__":
+    add_benchmarks(pyperf.Runner())
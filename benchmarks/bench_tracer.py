@@ -0,0 +1,55 @@
+"""Benchmarks de criação de spans pelo OtelTracer."""
+
+import pyperf
+
+from common import time_loops, tracer
+
+REMOTE_CONTEXT = {
+    "trace_id": "4bf92f3577b34da6a3ce929d0e0e4736",
+    "span_id": "00f067aa0ba902b7",
+    "trace_flags": 1,
+}
+
+
+def _root_span() -> None:
+    with tracer().start_root_span("bench.tracer.root"):
+        pass
+
+
+def _root_span_with_context() -> None:
+    with tracer().start_root_span("bench.tracer.remote", context=REMOTE_CONTEXT):
+        pass
+
+
+def _nested_spans() -> None:
+    app_tracer = tracer()
+    with app_tracer.start_root_span("bench.tracer.nested"):
+        with app_tracer.start_span_action("validate"):
+            pass
+        with app_tracer.start_span_action("persist"):
+            with app_tracer.start_span_action("commit"):
+                pass
+
+
+def bench_root_span(loops: int) -> float:
+    return time_loops(loops, _root_span)
+
+
+def bench_root_span_with_context(loops: int) -> float:
+    return time_loops(loops, _root_span_with_context)
+
+
+def bench_nested_spans(loops: int) -> float:
+    return time_loops(loops, _nested_spans)
+
+
+def add_benchmarks(runner: pyperf.Runner) -> None:
+    runner.bench_time_func("tracer_root_span", bench_root_span)
+    runner.bench_time_func(
+        "tracer_root_span_with_context", bench_root_span_with_context
+    )
+    runner.bench_time_func("tracer_nested_spans", bench_nested_spans)
+
+
+if __name__ == "__main__":
+    add_benchmarks(pyperf.Runner())
@@ -0,0 +1,59 @@
+"""Infraestrutura compartilhada pelos benchmarks.
+
+Todos os sinais são exportados para memória, sem rede nem console, para que o
+custo medido seja apenas o do toolkit e do SDK.
+"""
+
+from functools import cache
+from typing import Callable
+
+import pyperf
+from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+from opentelemetry.sdk.trace import Tracer, TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+    InMemorySpanExporter,
+)
+
+from microsservice_telemetry_toolkit import OtelTracer
+
+SERVICE_NAME = "benchmark-service"
+
+
+@cache
+def span_exporter() -> InMemorySpanExporter:
+    return InMemorySpanExporter()
+
+
+@cache
+def metric_reader() -> InMemoryMetricReader:
+    return InMemoryMetricReader()
+
+
+@cache
+def tracer() -> OtelTracer:
+    return OtelTracer(
+        service_name=SERVICE_NAME,
+        service_environment="benchmark",
+        span_exporter=span_exporter(),
+        metric_reader=metric_reader(),
+    )
+
+
+@cache
+def sdk_tracer() -> Tracer:
+    """Tracer do SDK ligado ao mesmo exporter em memória, para criar spans avulsos."""
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(span_exporter()))
+    return provider.get_tracer(SERVICE_NAME)
+
+
+def time_loops(loops: int, operation: Callable[[], None]) -> float:
+    """Executa a operação `loops` vezes e descarta os spans acumulados."""
+    range_it = range(loops)
+    t0 = pyperf.perf_counter()
+    for _ in range_it:
+        operation()
+    elapsed = pyperf.perf_counter() - t0
+    span_exporter().clear()
+    return elapsed
@@ -0,0 +1,43 @@
+"""Executa todos os benchmarks em uma única suíte pyperf.
+
+Uso:
+    uv run --with pyperf python benchmarks/run_suite.py \
+        -o benchmarks/results/<versão>.json
+
+As versões do toolkit e do SDK OpenTelemetry são gravadas nos metadados do
+resultado, para que `compare_to` evidencie comparações entre ambientes
+diferentes.
+"""
+
+from importlib.metadata import version
+
+import pyperf
+
+import microsservice_telemetry_toolkit
+
+import bench_logging
+import bench_metrics
+import bench_span_attributes
+import bench_span_context
+import bench_span_name_validator
+import bench_tracer
+
+MODULES = (
+    bench_tracer,
+    bench_span_name_validator,
+    bench_span_context,
+    bench_span_attributes,
+    bench_metrics,
+    bench_logging,
+)
+
+
+if __name__ == "__main__":
+    runner = pyperf.Runner(
+        metadata={
+            "toolkit_version": microsservice_telemetry_toolkit.__version__,
+            "opentelemetry_sdk_version": version("opentelemetry-sdk"),
+        }
+    )
+    for module in MODULES:
+        module.add_benchmarks(runner)
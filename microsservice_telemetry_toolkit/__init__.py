@@ -7,15 +7,29 @@ Principais exportações:
     - OtelTracer: Implementação principal do tracer para criação de spans
     - OtelSpan: Wrapper de span com métodos utilitários
     - OtelLogger: Configurador global de logging com OpenTelemetry
+    - TelemetryProfiler: Medição opcional do custo de CPU do próprio toolkit
+    - RingBufferSpanExporter: Buffer circular em memória com os últimos spans
+    - SpanBufferHTTPServer: Endpoint HTTP local para consulta do buffer de spans
+    - RuntimeMetricsCollector: Métricas de processo e runtime (RSS, CPU, GC, threads)
     - GenericTracer: Interface abstrata do tracer (porta)
     - GenericSpan: Interface abstrata do span (porta)
+    - SpanAttributes: Conjunto imutável de atributos pré-validados para spans
     - TextEncoder: Interface abstrata de codificador de texto (porta)
     - Base64TextEncoder: Implementação de codificador de texto em Base64
     - HTTPAuthHeaderMapper: Auxiliar para criação de cabeçalhos de autenticação HTTP
 """
 
 # Componentes principais de rastreamento e logging
-from .infrastructure import Base64TextEncoder, OtelTracer, OtelSpan, OtelLogger
+from .infrastructure import (
+    Base64TextEncoder,
+    OtelTracer,
+    OtelSpan,
+    OtelLogger,
+    TelemetryProfiler,
+    RingBufferSpanExporter,
+    SpanBufferHTTPServer,
+    RuntimeMetricsCollector,
+)
 
 # Portas do domínio (interfaces)
 from .domain import (
@@ -25,6 +39,7 @@ from .domain import (
     GenericGauge,
     GenericCounter,
     GenericUpDownCounter,
+    SpanAttributes,
     TextEncoder,
 )
 
@@ -38,6 +53,10 @@ __all__ = [
     "OtelTracer",
     "OtelSpan",
     "OtelLogger",
+    "TelemetryProfiler",
+    "RingBufferSpanExporter",
+    "SpanBufferHTTPServer",
+    "RuntimeMetricsCollector",
     # Interfaces/Portas
     "GenericTracer",
     "GenericSpan",
@@ -46,6 +65,8 @@ __all__ = [
     "GenericCounter",
     "GenericUpDownCounter",
     "TextEncoder",
+    # Objetos de valor
+    "SpanAttributes",
     # Implementações
     "Base64TextEncoder",
     # Serviços
@@ -9,6 +9,7 @@ from .port.generic_counter import GenericCounter
 from .port.generic_up_down_counter import GenericUpDownCounter
 from .port.text_encoder import TextEncoder
 from .value_object.app_log import AppLog
+from .value_object.span_attributes import SpanAttributes
 
 __all__ = [
     "ChainHandler",
@@ -20,4 +21,5 @@ __all__ = [
     "GenericUpDownCounter",
     "TextEncoder",
     "AppLog",
+    "SpanAttributes",
 ]
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from collections.abc import Mapping
 from typing import Any, TypedDict
 
 
@@ -25,8 +26,8 @@ class GenericSpan(ABC):
         ...
 
     @abstractmethod
-    def set_attributes(self, attributes: dict[str, Any]) -> None:
-        """Define múltiplos atributos no span."""
+    def set_attributes(self, attributes: Mapping[str, Any]) -> None:
+        """Define múltiplos atributos no span em uma única operação."""
         ...
 
     @abstractmethod
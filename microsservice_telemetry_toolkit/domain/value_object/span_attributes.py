@@ -0,0 +1,70 @@
+from collections.abc import ItemsView, Iterator, Mapping
+from typing import Any
+
+_PRIMITIVE_TYPES = (str, bool, int, float)
+
+
+class SpanAttributes(Mapping[str, Any]):
+    """Conjunto imutável de atributos de span, validado uma única vez na criação.
+
+    Chaves e valores são validados e as sequências congeladas em tuplas quando o
+    conjunto é criado. O resultado é um mapeamento reutilizável para atributos
+    constantes (ex: por rota); o SDK continua tratando os atributos a cada span.
+    """
+
+    __slots__ = ("_attributes",)
+
+    _attributes: dict[str, Any]
+
+    def __init__(self, attributes: Mapping[str, Any]):
+        validated: dict[str, Any] = {}
+        for key, value in attributes.items():
+            if not isinstance(key, str) or not key.strip():
+                raise ValueError(f"Attribute key must be a non-empty string: {key!r}")
+            validated[key] = self._freeze_value(key, value)
+        self._attributes = validated
+
+    @classmethod
+    def create(cls, attributes: Mapping[str, Any]) -> "SpanAttributes":
+        return cls(attributes)
+
+    @classmethod
+    def _from_validated(cls, attributes: dict[str, Any]) -> "SpanAttributes":
+        instance = cls.__new__(cls)
+        instance._attributes = attributes
+        return instance
+
+    @staticmethod
+    def _freeze_value(key: str, value: Any) -> Any:
+        if isinstance(value, _PRIMITIVE_TYPES):
+            return value
+        if isinstance(value, (list, tuple)):
+            if all(isinstance(item, _PRIMITIVE_TYPES) for item in value):
+                return tuple(value)
+        raise ValueError(
+            f"Attribute '{key}' must be a str, bool, int, float or a sequence of them"
+        )
+
+    def merge(self, attributes: Mapping[str, Any]) -> "SpanAttributes":
+        """Retorna um novo conjunto com os atributos informados sobrepostos."""
+        other = (
+            attributes
+            if isinstance(attributes, SpanAttributes)
+            else SpanAttributes.create(attributes)
+        )
+        return SpanAttributes._from_validated({**self._attributes, **other._attributes})
+
+    def __getitem__(self, key: str) -> Any:
+        return self._attributes[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._attributes)
+
+    def items(self) -> ItemsView[str, Any]:
+        return self._attributes.items()
+
+    def __len__(self) -> int:
+        return len(self._attributes)
+
+    def __repr__(self) -> str:
+        return f"SpanAttributes({self._attributes!r})"
@@ -8,6 +8,11 @@ from .otel_gauge import OtelGauge
 from .otel_counter import OtelCounter
 from .otel_up_down_counter import OtelUpDownCounter
 from .otel_logger import OtelLogger
+from .telemetry_profiler import TelemetryProfiler
+from .profiled_span_exporter import ProfiledSpanExporter
+from .ring_buffer_span_exporter import RingBufferSpanExporter
+from .span_buffer_http_server import SpanBufferHTTPServer
+from .runtime_metrics_collector import RuntimeMetricsCollector
 
 __all__ = [
     "Base64TextEncoder",
@@ -18,4 +23,9 @@ __all__ = [
     "OtelCounter",
     "OtelUpDownCounter",
     "OtelLogger",
+    "TelemetryProfiler",
+    "ProfiledSpanExporter",
+    "RingBufferSpanExporter",
+    "SpanBufferHTTPServer",
+    "RuntimeMetricsCollector",
 ]
@@ -2,11 +2,13 @@ from typing import Optional, Union, Any
 from opentelemetry.metrics import Counter
 
 from ..domain.port.generic_counter import GenericCounter
+from .telemetry_profiler import TelemetryProfiler
 
 
 class OtelCounter(GenericCounter):
-    def __init__(self, counter: Counter):
+    def __init__(self, counter: Counter, profiler: Optional[TelemetryProfiler] = None):
         self._counter = counter
+        self._profiler = profiler
 
     def add(
         self,
@@ -14,4 +16,9 @@ class OtelCounter(GenericCounter):
         attributes: Optional[Any] = None,
         context: Optional[Any] = None,
     ) -> None:
+        if self._profiler is None:
+            self._counter.add(amount, attributes=attributes, context=context)
+            return
+        start = self._profiler.start()
         self._counter.add(amount, attributes=attributes, context=context)
+        self._profiler.record("counter.add", start)
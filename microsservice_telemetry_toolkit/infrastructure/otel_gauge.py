@@ -2,11 +2,13 @@ from typing import Optional, Union, Any
 from opentelemetry.metrics import _Gauge as Gauge
 
 from ..domain.port.generic_gauge import GenericGauge
+from .telemetry_profiler import TelemetryProfiler
 
 
 class OtelGauge(GenericGauge):
-    def __init__(self, gauge: Gauge):
+    def __init__(self, gauge: Gauge, profiler: Optional[TelemetryProfiler] = None):
         self._gauge = gauge
+        self._profiler = profiler
 
     def set(
         self,
@@ -14,4 +16,9 @@ class OtelGauge(GenericGauge):
         attributes: Optional[Any] = None,
         context: Optional[Any] = None,
     ) -> None:
+        if self._profiler is None:
+            self._gauge.set(amount, attributes=attributes, context=context)
+            return
+        start = self._profiler.start()
         self._gauge.set(amount, attributes=attributes, context=context)
+        self._profiler.record("gauge.set", start)
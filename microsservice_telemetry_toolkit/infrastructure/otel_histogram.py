@@ -2,11 +2,15 @@ from typing import Optional, Union, Any
 from opentelemetry.metrics import Histogram
 
 from ..domain.port.generic_histogram import GenericHistogram
+from .telemetry_profiler import TelemetryProfiler
 
 
 class OtelHistogram(GenericHistogram):
-    def __init__(self, histogram: Histogram):
+    def __init__(
+        self, histogram: Histogram, profiler: Optional[TelemetryProfiler] = None
+    ):
         self._histogram = histogram
+        self._profiler = profiler
 
     def record(
         self,
@@ -14,4 +18,9 @@ class OtelHistogram(GenericHistogram):
         attributes: Optional[Any] = None,
         context: Optional[Any] = None,
     ) -> None:
+        if self._profiler is None:
+            self._histogram.record(amount, attributes=attributes, context=context)
+            return
+        start = self._profiler.start()
         self._histogram.record(amount, attributes=attributes, context=context)
+        self._profiler.record("histogram.record", start)
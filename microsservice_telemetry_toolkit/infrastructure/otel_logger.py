@@ -1,10 +1,15 @@
 from typing import Optional
 from opentelemetry.sdk.resources import Resource, SERVICE_NAME, DEPLOYMENT_ENVIRONMENT
-from opentelemetry.sdk._logs import LoggerProvider, LoggingHandler
+from opentelemetry.sdk._logs import (
+    LoggerProvider,
+    LoggingHandler,
+    LogRecordProcessor,
+)
 from opentelemetry.sdk._logs.export import (
     BatchLogRecordProcessor,
     SimpleLogRecordProcessor,
     ConsoleLogRecordExporter,
+    LogRecordExporter,
 )
 from opentelemetry.exporter.otlp.proto.http._log_exporter import OTLPLogExporter
 from opentelemetry._logs import set_logger_provider
@@ -19,6 +24,7 @@ class OtelLogger:
         log_level: int = logging.INFO,
         otlp_endpoint: Optional[str] = None,
         headers: Optional[dict[str, str]] = None,
+        log_exporter: Optional[LogRecordExporter] = None,
     ) -> None:
         resource = Resource.create(
             attributes={
@@ -28,13 +34,15 @@ class OtelLogger:
         )
 
         provider = LoggerProvider(resource=resource)
-        processor = (
-            BatchLogRecordProcessor(
+        processor: LogRecordProcessor
+        if log_exporter is not None:
+            processor = SimpleLogRecordProcessor(log_exporter)
+        elif otlp_endpoint:
+            processor = BatchLogRecordProcessor(
                 OTLPLogExporter(endpoint=otlp_endpoint, headers=headers)
             )
-            if otlp_endpoint
-            else SimpleLogRecordProcessor(ConsoleLogRecordExporter())
-        )
+        else:
+            processor = SimpleLogRecordProcessor(ConsoleLogRecordExporter())
         provider.add_log_record_processor(processor)
         set_logger_provider(provider)
 
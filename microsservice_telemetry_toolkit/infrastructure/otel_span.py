@@ -1,17 +1,23 @@
-from typing import Any
+from collections.abc import Mapping
+from typing import Any, Optional
 from opentelemetry import trace
 from opentelemetry.trace import Span, types
 
 from ..domain.port.generic_span import GenericSpan, SpanContext
+from .telemetry_profiler import TelemetryProfiler
 
 
 class OtelSpan(GenericSpan):
     name: str
     _span: Span
+    _profiler: Optional[TelemetryProfiler]
 
-    def __init__(self, name: str, span: Span):
+    def __init__(
+        self, name: str, span: Span, profiler: Optional[TelemetryProfiler] = None
+    ):
         self.name = name
         self._span = span
+        self._profiler = profiler
 
     def set_status_ok(self):
         self._span.set_status(trace.Status(trace.StatusCode.OK))
@@ -26,11 +32,20 @@ class OtelSpan(GenericSpan):
         key: str,
         value: types.AttributeValue,
     ):
+        if self._profiler is None:
+            self._span.set_attribute(key, value)
+            return
+        start = self._profiler.start()
         self._span.set_attribute(key, value)
+        self._profiler.record("span.set_attribute", start)
 
-    def set_attributes(self, attributes: dict[str, Any]) -> None:
-        for key, value in attributes.items():
-            self.set_attribute(key, value)
+    def set_attributes(self, attributes: Mapping[str, Any]) -> None:
+        if self._profiler is None:
+            self._span.set_attributes(attributes)
+            return
+        start = self._profiler.start()
+        self._span.set_attributes(attributes)
+        self._profiler.record("span.set_attributes", start)
 
     def get_context(self) -> SpanContext:
         ctx = self._span.get_span_context()
@@ -9,11 +9,15 @@ from opentelemetry.sdk.trace.export import (
     ConsoleSpanExporter,
     BatchSpanProcessor,
     SimpleSpanProcessor,
+    SpanExporter,
 )
 from opentelemetry.sdk.resources import DEPLOYMENT_ENVIRONMENT, SERVICE_NAME, Resource
 from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
 from opentelemetry.exporter.otlp.proto.http.metric_exporter import OTLPMetricExporter
-from opentelemetry.sdk.metrics.export import PeriodicExportingMetricReader
+from opentelemetry.sdk.metrics.export import (
+    MetricReader,
+    PeriodicExportingMetricReader,
+)
 from opentelemetry.trace import (
     SpanContext,
     TraceFlags,
@@ -32,6 +36,10 @@ from .otel_histogram import OtelHistogram
 from .otel_gauge import OtelGauge
 from .otel_counter import OtelCounter
 from .otel_up_down_counter import OtelUpDownCounter
+from .profiled_span_exporter import ProfiledSpanExporter
+from .ring_buffer_span_exporter import RingBufferSpanExporter
+from .runtime_metrics_collector import RuntimeMetricsCollector
+from .telemetry_profiler import TelemetryProfiler
 
 
 class OtelTracer(GenericTracer):
@@ -44,31 +52,64 @@ class OtelTracer(GenericTracer):
         tracer_otlp_endpoint: Optional[str] = None,
         meter_otlp_endpoint: Optional[str] = None,
         headers: Optional[dict[str, str]] = None,
+        profiler: Optional[TelemetryProfiler] = None,
+        span_exporter: Optional[SpanExporter] = None,
+        metric_reader: Optional[MetricReader] = None,
+        span_buffer_size: Optional[int] = None,
+        runtime_metrics: bool = False,
     ):
+        """`span_exporter` e `metric_reader` substituem o pipeline padrão e são
+        destinados a testes e benchmarks: o `span_exporter` exporta de forma
+        síncrona (SimpleSpanProcessor) a cada span finalizado.
+        """
+        self._profiler = profiler
+        self._span_buffer = (
+            RingBufferSpanExporter(span_buffer_size)
+            if span_buffer_size is not None
+            else None
+        )
         resource = Resource.create(
             attributes={
                 SERVICE_NAME: service_name,
                 DEPLOYMENT_ENVIRONMENT: service_environment,
             }
         )
-        self._tracer = self._define_tracer(resource, tracer_otlp_endpoint, headers)
-        self._meter = self._define_meter(resource, meter_otlp_endpoint, headers)
+        self._tracer = self._define_tracer(
+            resource, tracer_otlp_endpoint, headers, span_exporter
+        )
+        self._meter = self._define_meter(
+            resource, meter_otlp_endpoint, headers, metric_reader
+        )
+        if profiler is not None:
+            profiler.register_metrics(self._meter)
+        self._runtime_metrics = RuntimeMetricsCollector() if runtime_metrics else None
+        if self._runtime_metrics is not None:
+            self._runtime_metrics.register(self._meter)
 
     def _define_tracer(
         self,
         resource: Resource,
         otlp_endpoint: Optional[str],
         headers: Optional[dict[str, str]],
+        span_exporter: Optional[SpanExporter],
     ):
         provider = TracerProvider(resource=resource)
+        use_otlp = span_exporter is None and bool(otlp_endpoint)
+        exporter: SpanExporter
+        if span_exporter is not None:
+            exporter = span_exporter
+        elif otlp_endpoint:
+            exporter = OTLPSpanExporter(endpoint=otlp_endpoint, headers=headers)
+        else:
+            exporter = ConsoleSpanExporter()
+        if self._profiler is not None:
+            exporter = ProfiledSpanExporter(exporter, self._profiler)
         tracer_processor = (
-            BatchSpanProcessor(
-                OTLPSpanExporter(endpoint=otlp_endpoint, headers=headers)
-            )
-            if otlp_endpoint
-            else SimpleSpanProcessor(ConsoleSpanExporter())
+            BatchSpanProcessor(exporter) if use_otlp else SimpleSpanProcessor(exporter)
         )
         provider.add_span_processor(tracer_processor)
+        if self._span_buffer is not None:
+            provider.add_span_processor(SimpleSpanProcessor(self._span_buffer))
         trace.set_tracer_provider(provider)
         return provider.get_tracer(f"{resource.attributes[SERVICE_NAME]}-tracer")
 
@@ -77,17 +118,38 @@ class OtelTracer(GenericTracer):
         resource: Resource,
         otlp_endpoint: Optional[str],
         headers: Optional[dict[str, str]],
+        metric_reader: Optional[MetricReader],
     ):
-        exporter = OTLPMetricExporter(endpoint=otlp_endpoint, headers=headers)
-        reader = PeriodicExportingMetricReader(exporter)
+        reader = (
+            metric_reader
+            if metric_reader is not None
+            else PeriodicExportingMetricReader(
+                OTLPMetricExporter(endpoint=otlp_endpoint, headers=headers)
+            )
+        )
         provider = MeterProvider(metric_readers=[reader], resource=resource)
         metrics.set_meter_provider(provider)
         return provider.get_meter(f"{resource.attributes[SERVICE_NAME]}-meter")
 
+    @property
+    def span_buffer(self) -> Optional[RingBufferSpanExporter]:
+        """Últimos spans finalizados, quando `span_buffer_size` é informado."""
+        return self._span_buffer
+
+    @property
+    def runtime_metrics(self) -> Optional[RuntimeMetricsCollector]:
+        """Coletor de métricas de runtime, quando `runtime_metrics=True`."""
+        return self._runtime_metrics
+
+    def close(self) -> None:
+        """Libera os recursos de processo registrados pelo tracer (ex: hook do GC)."""
+        if self._runtime_metrics is not None:
+            self._runtime_metrics.close()
+
     @contextmanager
     def start_root_span(self, name: str, context: Optional[GenericSpanContext] = None):
-        validator = SpanNameValidator(parts_count=3)
-        validator.validate(name)
+        self._validate_name(name, parts_count=3)
+        start = self._profiler.start() if self._profiler else 0
         stack = self._span_stack.get() or []
         if stack:
             raise RuntimeError(
@@ -106,30 +168,57 @@ class OtelTracer(GenericTracer):
             )
             non_recording_span = NonRecordingSpan(span_context)
             otel_context = set_span_in_context(non_recording_span)
-        with self._tracer.start_as_current_span(name, context=otel_context) as span:
-            new_stack = [name]
-            token = self._span_stack.set(new_stack)
-            try:
-                yield OtelSpan(name, span)
-            finally:
-                self._span_stack.reset(token)
+        exit_start = 0
+        try:
+            with self._tracer.start_as_current_span(name, context=otel_context) as span:
+                new_stack = [name]
+                token = self._span_stack.set(new_stack)
+                self._record("tracer.start_root_span.enter", start)
+                try:
+                    yield OtelSpan(name, span, self._profiler)
+                finally:
+                    exit_start = self._profiler.start() if self._profiler else 0
+                    self._span_stack.reset(token)
+        finally:
+            self._record("tracer.start_root_span.exit", exit_start)
 
     @contextmanager
     def start_span_action(self, name: str):
-        validator = SpanNameValidator(parts_count=1)
-        validator.validate(name)
+        self._validate_name(name, parts_count=1)
+        start = self._profiler.start() if self._profiler else 0
         stack = self._span_stack.get() or []
         if not stack:
             raise RuntimeError("No active span found to create an action span.")
         parent_name = stack[-1]
         full_name = f"{parent_name}.{name}"
-        with self._tracer.start_as_current_span(full_name) as span:
-            new_stack = stack + [full_name]
-            token = self._span_stack.set(new_stack)
-            try:
-                yield OtelSpan(full_name, span)
-            finally:
-                self._span_stack.reset(token)
+        exit_start = 0
+        try:
+            with self._tracer.start_as_current_span(full_name) as span:
+                new_stack = stack + [full_name]
+                token = self._span_stack.set(new_stack)
+                self._record("tracer.start_span_action.enter", start)
+                try:
+                    yield OtelSpan(full_name, span, self._profiler)
+                finally:
+                    exit_start = self._profiler.start() if self._profiler else 0
+                    self._span_stack.reset(token)
+        finally:
+            self._record("tracer.start_span_action.exit", exit_start)
+
+    def _validate_name(self, name: str, parts_count: int) -> None:
+        validator = SpanNameValidator(parts_count=parts_count)
+        if self._profiler is None:
+            validator.validate(name)
+            return
+        start = self._profiler.start()
+        try:
+            validator.validate(name)
+        finally:
+            self._profiler.record("span_name_validator.validate", start)
+
+    def _record(self, section: str, start: int) -> None:
+        if self._profiler is not None and start:
+            self._profiler.record(section, start)
 
     def extract_context_from(
         self, carrier: dict[str, Any]
@@ -150,13 +239,13 @@ class OtelTracer(GenericTracer):
         self, name: str, unit: str = "", description: str = ""
     ) -> GenericGauge:
         gauge = self._meter.create_gauge(name, unit, description)
-        return OtelGauge(gauge)
+        return OtelGauge(gauge, self._profiler)
 
     def create_counter(
         self, name: str, unit: str = "", description: str = ""
     ) -> GenericCounter:
         counter = self._meter.create_counter(name, unit, description)
-        return OtelCounter(counter)
+        return OtelCounter(counter, self._profiler)
 
     def create_histogram(
         self,
@@ -168,13 +257,13 @@ class OtelTracer(GenericTracer):
         histogram = self._meter.create_histogram(
             name, unit, description, explicit_bucket_boundaries_advisory=breakpoints
         )
-        return OtelHistogram(histogram)
+        return OtelHistogram(histogram, self._profiler)
 
     def create_up_down_counter(
         self, name: str, unit: str = "", description: str = ""
     ) -> GenericUpDownCounter:
         counter = self._meter.create_up_down_counter(name, unit, description)
-        return OtelUpDownCounter(counter)
+        return OtelUpDownCounter(counter, self._profiler)
 
     def _cast_trace_id(self, trace_id: str) -> int:
         if len(trace_id) != 32:
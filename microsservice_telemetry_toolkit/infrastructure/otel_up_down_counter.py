@@ -2,11 +2,15 @@ from typing import Optional, Union, Any
 from opentelemetry.metrics import UpDownCounter
 
 from ..domain.port.generic_up_down_counter import GenericUpDownCounter
+from .telemetry_profiler import TelemetryProfiler
 
 
 class OtelUpDownCounter(GenericUpDownCounter):
-    def __init__(self, counter: UpDownCounter):
+    def __init__(
+        self, counter: UpDownCounter, profiler: Optional[TelemetryProfiler] = None
+    ):
         self._counter = counter
+        self._profiler = profiler
 
     def add(
         self,
@@ -14,4 +18,9 @@ class OtelUpDownCounter(GenericUpDownCounter):
         attributes: Optional[Any] = None,
         context: Optional[Any] = None,
     ) -> None:
+        if self._profiler is None:
+            self._counter.add(amount, attributes=attributes, context=context)
+            return
+        start = self._profiler.start()
         self._counter.add(amount, attributes=attributes, context=context)
+        self._profiler.record("up_down_counter.add", start)
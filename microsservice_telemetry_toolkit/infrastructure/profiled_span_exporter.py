@@ -0,0 +1,27 @@
+from typing import Sequence
+
+from opentelemetry.sdk.trace import ReadableSpan
+from opentelemetry.sdk.trace.export import SpanExporter, SpanExportResult
+
+from .telemetry_profiler import TelemetryProfiler
+
+
+class ProfiledSpanExporter(SpanExporter):
+    """Decora um SpanExporter medindo o tempo de cada lote exportado."""
+
+    def __init__(self, exporter: SpanExporter, profiler: TelemetryProfiler):
+        self._exporter = exporter
+        self._profiler = profiler
+
+    def export(self, spans: Sequence[ReadableSpan]) -> SpanExportResult:
+        start = self._profiler.start()
+        try:
+            return self._exporter.export(spans)
+        finally:
+            self._profiler.record("exporter.export", start)
+
+    def shutdown(self) -> None:
+        self._exporter.shutdown()
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        return self._exporter.force_flush(timeout_millis)
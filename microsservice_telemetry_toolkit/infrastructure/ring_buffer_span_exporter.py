@@ -0,0 +1,132 @@
+import threading
+from typing import Any, Optional, Sequence
+
+from opentelemetry.sdk.trace import ReadableSpan
+from opentelemetry.sdk.trace.export import SpanExporter, SpanExportResult
+
+
+class RingBufferSpanExporter(SpanExporter):
+    """Mantém em memória os últimos `capacity` spans finalizados.
+
+    Os spans ficam em um buffer circular de tamanho fixo, indexados por
+    trace_id e por cada prefixo do nome (ex: "service", "service.domain",
+    "service.domain.operation"). O consumo de memória é constante,
+    independentemente do volume de tráfego.
+    """
+
+    def __init__(self, capacity: int = 1000):
+        if capacity <= 0:
+            raise ValueError("capacity must be greater than zero")
+        self._capacity = capacity
+        self._slots: list[Optional[ReadableSpan]] = [None] * capacity
+        self._next_slot = 0
+        self._by_trace_id: dict[str, set[int]] = {}
+        self._by_name_prefix: dict[str, set[int]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    def export(self, spans: Sequence[ReadableSpan]) -> SpanExportResult:
+        with self._lock:
+            for span in spans:
+                self._store(span)
+        return SpanExportResult.SUCCESS
+
+    def shutdown(self) -> None:
+        self.clear()
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        return True
+
+    def clear(self) -> None:
+        with self._lock:
+            self._slots = [None] * self._capacity
+            self._next_slot = 0
+            self._by_trace_id = {}
+            self._by_name_prefix = {}
+
+    def get_spans(self, limit: Optional[int] = None) -> list[ReadableSpan]:
+        """Retorna os spans armazenados, do mais antigo para o mais recente."""
+        if limit is not None and limit <= 0:
+            raise ValueError("limit must be greater than zero")
+        with self._lock:
+            ordered = self._slots[self._next_slot :] + self._slots[: self._next_slot]
+            spans = [span for span in ordered if span is not None]
+        return spans[-limit:] if limit is not None else spans
+
+    def find_by_trace_id(self, trace_id: str) -> list[ReadableSpan]:
+        with self._lock:
+            return self._collect(self._by_trace_id.get(trace_id.lower(), set()))
+
+    def find_by_name_prefix(self, prefix: str) -> list[ReadableSpan]:
+        """Busca por prefixo de nome alinhado às partes separadas por '.'."""
+        with self._lock:
+            return self._collect(self._by_name_prefix.get(prefix, set()))
+
+    def _store(self, span: ReadableSpan) -> None:
+        slot = self._next_slot
+        previous = self._slots[slot]
+        if previous is not None:
+            self._unindex(previous, slot)
+        self._slots[slot] = span
+        self._index(span, slot)
+        self._next_slot = (slot + 1) % self._capacity
+
+    def _index(self, span: ReadableSpan, slot: int) -> None:
+        self._by_trace_id.setdefault(_trace_id_of(span), set()).add(slot)
+        for prefix in _name_prefixes(span.name):
+            self._by_name_prefix.setdefault(prefix, set()).add(slot)
+
+    def _unindex(self, span: ReadableSpan, slot: int) -> None:
+        self._discard(self._by_trace_id, _trace_id_of(span), slot)
+        for prefix in _name_prefixes(span.name):
+            self._discard(self._by_name_prefix, prefix, slot)
+
+    @staticmethod
+    def _discard(index: dict[str, set[int]], key: str, slot: int) -> None:
+        slots = index.get(key)
+        if slots is None:
+            return
+        slots.discard(slot)
+        if not slots:
+            del index[key]
+
+    def _collect(self, slots: set[int]) -> list[ReadableSpan]:
+        # Ordena por idade: o slot mais antigo é o próximo a ser sobrescrito.
+        ordered = sorted(
+            slots, key=lambda slot: (slot - self._next_slot) % self._capacity
+        )
+        return [span for span in (self._slots[slot] for slot in ordered) if span]
+
+
+def span_to_dict(span: ReadableSpan) -> dict[str, Any]:
+    ctx = span.get_span_context()
+    parent_id = format(span.parent.span_id, "016x") if span.parent else None
+    duration_ms = (
+        (span.end_time - span.start_time) / 1e6
+        if span.end_time is not None and span.start_time is not None
+        else None
+    )
+    return {
+        "name": span.name,
+        "trace_id": format(ctx.trace_id, "032x") if ctx else None,
+        "span_id": format(ctx.span_id, "016x") if ctx else None,
+        "parent_id": parent_id,
+        "start_time": span.start_time,
+        "end_time": span.end_time,
+        "duration_ms": duration_ms,
+        "status": span.status.status_code.name,
+        "attributes": dict(span.attributes or {}),
+    }
+
+
+def _trace_id_of(span: ReadableSpan) -> str:
+    ctx = span.get_span_context()
+    return format(ctx.trace_id, "032x") if ctx else ""
+
+
+def _name_prefixes(name: str) -> list[str]:
+    parts = name.split(".")
+    return [".".join(parts[: i + 1]) for i in range(len(parts))]
@@ -0,0 +1,172 @@
+import asyncio
+import gc
+import os
+import threading
+import weakref
+from time import perf_counter
+from typing import Any, Iterable, Optional
+
+from opentelemetry.metrics import CallbackOptions, Meter, Observation
+
+
+class RuntimeMetricsCollector:
+    """Registra métricas do processo e do runtime como instrumentos observáveis.
+
+    Os valores são lidos apenas quando o meter coleta as métricas para
+    exportação. Coletas e pausas do GC são contadas por um callback em
+    `gc.callbacks` a partir de `register()`, e o atraso do event loop só é
+    medido após `monitor_event_loop`. `close()` remove o callback do GC e
+    interrompe as sondas.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._gc_collections = [0] * len(gc.get_stats())
+        self._gc_pause_seconds = [0.0] * len(gc.get_stats())
+        self._gc_started_at: Optional[float] = None
+        self._loop_lag_seconds = 0.0
+        self._loop_monitored = False
+        self._monitored_loops: weakref.WeakSet[asyncio.AbstractEventLoop] = (
+            weakref.WeakSet()
+        )
+        self._closed = False
+        self._page_size = self._read_page_size()
+
+    def register(self, meter: Meter) -> None:
+        meter.create_observable_gauge(
+            "process.memory.usage",
+            callbacks=[self._observe_rss],
+            unit="By",
+            description="Memória residente (RSS) do processo",
+        )
+        meter.create_observable_counter(
+            "process.cpu.time",
+            callbacks=[self._observe_cpu_time],
+            unit="s",
+            description="Tempo de CPU consumido pelo processo",
+        )
+        meter.create_observable_gauge(
+            "process.thread.count",
+            callbacks=[self._observe_thread_count],
+            unit="{thread}",
+            description="Quantidade de threads ativas",
+        )
+        meter.create_observable_counter(
+            "cpython.gc.collections",
+            callbacks=[self._observe_gc_collections],
+            unit="{collection}",
+            description="Coletas do GC desde o registro, por geração",
+        )
+        meter.create_observable_counter(
+            "cpython.gc.pause_time",
+            callbacks=[self._observe_gc_pause_time],
+            unit="s",
+            description="Tempo de pausa do GC desde o registro, por geração",
+        )
+        meter.create_observable_gauge(
+            "python.asyncio.event_loop.lag",
+            callbacks=[self._observe_loop_lag],
+            unit="s",
+            description="Maior atraso do event loop desde a última coleta",
+        )
+        if self._on_gc not in gc.callbacks:
+            gc.callbacks.append(self._on_gc)
+
+    def monitor_event_loop(
+        self,
+        loop: Optional[asyncio.AbstractEventLoop] = None,
+        interval: float = 0.5,
+    ) -> None:
+        """Agenda uma sonda periódica no event loop para medir seu atraso.
+
+        Chamadas repetidas para o mesmo loop não agendam uma nova sonda.
+        """
+        loop = loop or asyncio.get_running_loop()
+        with self._lock:
+            if self._closed or loop in self._monitored_loops:
+                return
+            self._monitored_loops.add(loop)
+            self._loop_monitored = True
+        loop.call_soon_threadsafe(self._schedule_loop_probe, loop, interval)
+
+    def close(self) -> None:
+        self._closed = True
+        if self._on_gc in gc.callbacks:
+            gc.callbacks.remove(self._on_gc)
+
+    def _schedule_loop_probe(
+        self, loop: asyncio.AbstractEventLoop, interval: float
+    ) -> None:
+        if self._closed:
+            return
+        expected = loop.time() + interval
+        loop.call_later(interval, self._loop_probe, loop, interval, expected)
+
+    def _loop_probe(
+        self, loop: asyncio.AbstractEventLoop, interval: float, expected: float
+    ) -> None:
+        lag = max(loop.time() - expected, 0.0)
+        with self._lock:
+            self._loop_lag_seconds = max(self._loop_lag_seconds, lag)
+        self._schedule_loop_probe(loop, interval)
+
+    def _on_gc(self, phase: str, info: dict[str, Any]) -> None:
+        if phase == "start":
+            self._gc_started_at = perf_counter()
+        elif phase == "stop" and self._gc_started_at is not None:
+            generation = info["generation"]
+            self._gc_collections[generation] += 1
+            self._gc_pause_seconds[generation] += perf_counter() - self._gc_started_at
+            self._gc_started_at = None
+
+    def _observe_rss(self, options: CallbackOptions) -> Iterable[Observation]:
+        rss = self._read_rss()
+        return [Observation(rss)] if rss is not None else []
+
+    def _observe_cpu_time(self, options: CallbackOptions) -> Iterable[Observation]:
+        times = os.times()
+        return [
+            Observation(times.user, {"cpu.mode": "user"}),
+            Observation(times.system, {"cpu.mode": "system"}),
+        ]
+
+    def _observe_thread_count(self, options: CallbackOptions) -> Iterable[Observation]:
+        return [Observation(threading.active_count())]
+
+    def _observe_gc_collections(
+        self, options: CallbackOptions
+    ) -> Iterable[Observation]:
+        return [
+            Observation(count, {"cpython.gc.generation": generation})
+            for generation, count in enumerate(self._gc_collections)
+        ]
+
+    def _observe_gc_pause_time(self, options: CallbackOptions) -> Iterable[Observation]:
+        return [
+            Observation(seconds, {"cpython.gc.generation": generation})
+            for generation, seconds in enumerate(self._gc_pause_seconds)
+        ]
+
+    def _observe_loop_lag(self, options: CallbackOptions) -> Iterable[Observation]:
+        if not self._loop_monitored:
+            return []
+        with self._lock:
+            lag = self._loop_lag_seconds
+            self._loop_lag_seconds = 0.0
+        return [Observation(lag)]
+
+    def _read_rss(self) -> Optional[int]:
+        if self._page_size is None:
+            return None
+        try:
+            with open("/proc/self/statm", "rb") as statm:
+                return int(statm.read().split()[1]) * self._page_size
+        except (OSError, IndexError, ValueError):
+            return None
+
+    @staticmethod
+    def _read_page_size() -> Optional[int]:
+        try:
+            return os.sysconf("SC_PAGE_SIZE")
+        except (AttributeError, ValueError, OSError):
+            return None
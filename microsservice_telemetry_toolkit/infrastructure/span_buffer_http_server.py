@@ -0,0 +1,108 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+from urllib.parse import parse_qs, urlparse
+
+from .ring_buffer_span_exporter import RingBufferSpanExporter, span_to_dict
+
+
+class SpanBufferHTTPServer:
+    """Endpoint HTTP local, somente leitura, para consultar o RingBufferSpanExporter.
+
+    GET /spans aceita os parâmetros opcionais `trace_id`, `name_prefix` e
+    `limit` e responde com uma lista JSON de spans, do mais antigo para o mais
+    recente. O socket só é aberto em `start()`.
+    """
+
+    def __init__(
+        self,
+        span_buffer: RingBufferSpanExporter,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        self._span_buffer = span_buffer
+        self._host = host
+        self._port = port
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def address(self) -> tuple[str, int]:
+        """Endereço efetivo após `start()` (inclusive a porta quando `port=0`)."""
+        if self._server is None:
+            return self._host, self._port
+        host, port = self._server.server_address[:2]
+        return str(host), int(port)
+
+    def start(self) -> None:
+        if self._server is not None:
+            return
+        self._server = ThreadingHTTPServer(
+            (self._host, self._port), self._handler_class()
+        )
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(
+            target=self._server.serve_forever,
+            name="span-buffer-http-server",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._server is None:
+            return
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+        self._server = None
+
+    def _handler_class(self) -> type[BaseHTTPRequestHandler]:
+        span_buffer = self._span_buffer
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                url = urlparse(self.path)
+                if url.path != "/spans":
+                    self._respond(404, {"error": "not found"})
+                    return
+                query = {key: values[0] for key, values in parse_qs(url.query).items()}
+                try:
+                    limit = int(query["limit"]) if "limit" in query else None
+                except ValueError:
+                    self._respond(400, {"error": "limit must be an integer"})
+                    return
+                if limit is not None and limit <= 0:
+                    self._respond(400, {"error": "limit must be greater than zero"})
+                    return
+                prefix = query.get("name_prefix")
+                if "trace_id" in query:
+                    spans = span_buffer.find_by_trace_id(query["trace_id"])
+                    if prefix:
+                        spans = [
+                            span
+                            for span in spans
+                            if span.name == prefix or span.name.startswith(f"{prefix}.")
+                        ]
+                elif prefix:
+                    spans = span_buffer.find_by_name_prefix(prefix)
+                else:
+                    spans = span_buffer.get_spans()
+                if limit is not None:
+                    spans = spans[-limit:]
+                self._respond(200, [span_to_dict(span) for span in spans])
+
+            def _respond(self, status: int, body: object) -> None:
+                payload = json.dumps(body).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format: str, *args: object) -> None:
+                return
+
+        return Handler
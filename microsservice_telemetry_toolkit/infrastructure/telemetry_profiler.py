@@ -0,0 +1,170 @@
+import threading
+from time import perf_counter_ns
+from typing import Iterable, TypedDict
+
+from opentelemetry.metrics import CallbackOptions, Meter, Observation
+
+# Cada potência de dois é dividida em 2 ** _SUB_BUCKET_BITS sub-buckets,
+# o que limita o erro relativo dos percentis a 25%.
+_SUB_BUCKET_BITS = 2
+_SUB_BUCKETS = 1 << _SUB_BUCKET_BITS
+_BUCKETS_COUNT = 64 * _SUB_BUCKETS
+
+
+def _bucket_index(value_ns: int) -> int:
+    if value_ns < _SUB_BUCKETS:
+        return max(value_ns, 0)
+    shift = value_ns.bit_length() - _SUB_BUCKET_BITS - 1
+    return (shift + 1) * _SUB_BUCKETS + ((value_ns >> shift) & (_SUB_BUCKETS - 1))
+
+
+def _bucket_upper_bound(index: int) -> int:
+    if index < _SUB_BUCKETS:
+        return index + 1
+    shift = index // _SUB_BUCKETS - 1
+    lower = (_SUB_BUCKETS + index % _SUB_BUCKETS) << shift
+    return lower + (1 << shift)
+
+
+class SectionReport(TypedDict):
+    count: int
+    total_ms: float
+    mean_us: float
+    min_us: float
+    p50_us: float
+    p90_us: float
+    p99_us: float
+    max_us: float
+
+
+class _SectionStats:
+    __slots__ = ("count", "total_ns", "min_ns", "max_ns", "buckets")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total_ns = 0
+        self.min_ns = 0
+        self.max_ns = 0
+        self.buckets = [0] * _BUCKETS_COUNT
+
+    def add(self, elapsed_ns: int) -> None:
+        if self.count == 0 or elapsed_ns < self.min_ns:
+            self.min_ns = elapsed_ns
+        if elapsed_ns > self.max_ns:
+            self.max_ns = elapsed_ns
+        self.count += 1
+        self.total_ns += elapsed_ns
+        self.buckets[_bucket_index(elapsed_ns)] += 1
+
+    def percentile_ns(self, quantile: float) -> int:
+        threshold = quantile * self.count
+        cumulative = 0
+        for index, bucket_count in enumerate(self.buckets):
+            cumulative += bucket_count
+            if bucket_count and cumulative >= threshold:
+                return min(_bucket_upper_bound(index), self.max_ns)
+        return self.max_ns
+
+    def to_report(self) -> SectionReport:
+        return {
+            "count": self.count,
+            "total_ms": self.total_ns / 1e6,
+            "mean_us": self.total_ns / self.count / 1e3 if self.count else 0.0,
+            "min_us": self.min_ns / 1e3,
+            "p50_us": self.percentile_ns(0.50) / 1e3,
+            "p90_us": self.percentile_ns(0.90) / 1e3,
+            "p99_us": self.percentile_ns(0.99) / 1e3,
+            "max_us": self.max_ns / 1e3,
+        }
+
+
+class TelemetryProfiler:
+    """Mede o custo de CPU do próprio toolkit, agregado por seção.
+
+    Opcional: só é usado quando informado ao OtelTracer. Cada medição custa um
+    perf_counter_ns e a atualização de um histograma em buckets logarítmicos.
+    """
+
+    def __init__(self) -> None:
+        self._sections: dict[str, _SectionStats] = {}
+        # Totais acumulados desde a criação, expostos como contadores
+        # monotônicos; não são afetados por reset().
+        self._totals: dict[str, list[int]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def start() -> int:
+        return perf_counter_ns()
+
+    def record(self, section: str, start_ns: int) -> None:
+        elapsed_ns = perf_counter_ns() - start_ns
+        with self._lock:
+            stats = self._sections.get(section)
+            if stats is None:
+                stats = self._sections[section] = _SectionStats()
+            stats.add(elapsed_ns)
+            totals = self._totals.get(section)
+            if totals is None:
+                totals = self._totals[section] = [0, 0]
+            totals[0] += 1
+            totals[1] += elapsed_ns
+
+    def reset(self) -> None:
+        """Zera o relatório; as métricas exportadas continuam acumulando."""
+        with self._lock:
+            self._sections = {}
+
+    def report(self) -> dict[str, SectionReport]:
+        with self._lock:
+            return {
+                section: stats.to_report()
+                for section, stats in sorted(self._sections.items())
+            }
+
+    def format_report(self) -> str:
+        header = (
+            f"{'section':<36} {'count':>10} {'total_ms':>10} {'mean_us':>9} "
+            f"{'p50_us':>9} {'p90_us':>9} {'p99_us':>9} {'max_us':>9}"
+        )
+        lines = [header, "-" * len(header)]
+        for section, data in self.report().items():
+            lines.append(
+                f"{section:<36} {data['count']:>10} {data['total_ms']:>10.3f} "
+                f"{data['mean_us']:>9.2f} {data['p50_us']:>9.2f} "
+                f"{data['p90_us']:>9.2f} {data['p99_us']:>9.2f} {data['max_us']:>9.2f}"
+            )
+        return "\n".join(lines)
+
+    def register_metrics(self, meter: Meter) -> None:
+        """Expõe os totais por seção como contadores observáveis no meter."""
+        meter.create_observable_counter(
+            "telemetry.toolkit.overhead.time",
+            callbacks=[self._observe_time],
+            unit="s",
+            description="Tempo de CPU gasto pelo toolkit de telemetria, por seção",
+        )
+        meter.create_observable_counter(
+            "telemetry.toolkit.overhead.calls",
+            callbacks=[self._observe_calls],
+            unit="{call}",
+            description="Quantidade de operações medidas do toolkit, por seção",
+        )
+
+    def _snapshot(self) -> list[tuple[str, int, int]]:
+        with self._lock:
+            return [
+                (section, count, total_ns)
+                for section, (count, total_ns) in self._totals.items()
+            ]
+
+    def _observe_time(self, options: CallbackOptions) -> Iterable[Observation]:
+        return [
+            Observation(total_ns / 1e9, {"section": section})
+            for section, _, total_ns in self._snapshot()
+        ]
+
+    def _observe_calls(self, options: CallbackOptions) -> Iterable[Observation]:
+        return [
+            Observation(count, {"section": section})
+            for section, count, _ in self._snapshot()
+        ]
@@ -0,0 +1,202 @@
+import json
+import unittest
+from urllib.error import HTTPError
+from urllib.request import urlopen
+
+from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+    InMemorySpanExporter,
+)
+from opentelemetry.trace import set_span_in_context
+
+from microsservice_telemetry_toolkit import (
+    OtelTracer,
+    RingBufferSpanExporter,
+    SpanBufferHTTPServer,
+)
+
+
+def _trace_id(span) -> str:
+    return format(span.get_span_context().trace_id, "032x")
+
+
+class RingBufferSpanExporterTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.buffer = RingBufferSpanExporter(capacity=3)
+        provider = TracerProvider()
+        provider.add_span_processor(SimpleSpanProcessor(self.buffer))
+        self.tracer = provider.get_tracer("test")
+
+    def _finish(self, name: str):
+        span = self.tracer.start_span(name)
+        span.end()
+        return span
+
+    def test_keeps_last_spans_oldest_first_after_wrap_around(self) -> None:
+        for i in range(5):
+            self._finish(f"svc.domain.op{i}")
+
+        names = [span.name for span in self.buffer.get_spans()]
+
+        self.assertEqual(names, ["svc.domain.op2", "svc.domain.op3", "svc.domain.op4"])
+        self.assertEqual(
+            [span.name for span in self.buffer.get_spans(limit=2)],
+            ["svc.domain.op3", "svc.domain.op4"],
+        )
+
+    def test_overwrite_removes_evicted_span_from_indexes(self) -> None:
+        evicted = self._finish("svc.old.op")
+        for _ in range(3):
+            self._finish("svc.new.op")
+
+        self.assertEqual(self.buffer.find_by_trace_id(_trace_id(evicted)), [])
+        self.assertEqual(self.buffer.find_by_name_prefix("svc.old"), [])
+        self.assertNotIn(_trace_id(evicted), self.buffer._by_trace_id)
+        self.assertNotIn("svc.old", self.buffer._by_name_prefix)
+        self.assertNotIn("svc.old.op", self.buffer._by_name_prefix)
+        self.assertEqual(len(self.buffer.find_by_name_prefix("svc")), 3)
+
+    def test_name_prefix_matches_whole_parts_only(self) -> None:
+        self._finish("svc.order.create")
+        self._finish("svc.orders.list")
+
+        self.assertEqual(
+            [span.name for span in self.buffer.find_by_name_prefix("svc.order")],
+            ["svc.order.create"],
+        )
+        self.assertEqual(self.buffer.find_by_name_prefix("svc.ord"), [])
+
+    def test_find_by_trace_id_is_ordered_after_wrap_around(self) -> None:
+        self._finish("svc.domain.filler")
+        root = self.tracer.start_span("svc.domain.root")
+        child = self.tracer.start_span(
+            "svc.domain.root.child", context=set_span_in_context(root)
+        )
+        child.end()
+        root.end()
+        self._finish("svc.domain.other")
+
+        spans = self.buffer.find_by_trace_id(_trace_id(root).upper())
+
+        self.assertEqual(
+            [span.name for span in spans],
+            ["svc.domain.root.child", "svc.domain.root"],
+        )
+
+    def test_rejects_non_positive_limit(self) -> None:
+        for limit in (0, -1):
+            with self.assertRaises(ValueError):
+                self.buffer.get_spans(limit=limit)
+
+
+class SpanBufferHTTPServerTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.buffer = RingBufferSpanExporter(capacity=10)
+        provider = TracerProvider()
+        provider.add_span_processor(SimpleSpanProcessor(self.buffer))
+        tracer = provider.get_tracer("test")
+        self.spans = []
+        for name in ("svc.order.create", "svc.order.create.save", "svc.user.get"):
+            span = tracer.start_span(name)
+            span.end()
+            self.spans.append(span)
+        self.server = SpanBufferHTTPServer(self.buffer)
+        self.server.start()
+        self.addCleanup(self.server.stop)
+
+    def _get(self, query: str = ""):
+        host, port = self.server.address
+        with urlopen(f"http://{host}:{port}/spans{query}") as response:
+            return json.loads(response.read())
+
+    def _status(self, path: str) -> int:
+        host, port = self.server.address
+        try:
+            with urlopen(f"http://{host}:{port}{path}") as response:
+                return response.status
+        except HTTPError as error:
+            return error.code
+
+    def test_lists_all_spans(self) -> None:
+        self.assertEqual(len(self._get()), 3)
+
+    def test_filters_by_name_prefix_and_limit(self) -> None:
+        names = [span["name"] for span in self._get("?name_prefix=svc.order")]
+        self.assertEqual(names, ["svc.order.create", "svc.order.create.save"])
+        names = [span["name"] for span in self._get("?name_prefix=svc&limit=1")]
+        self.assertEqual(names, ["svc.user.get"])
+
+    def test_filters_by_trace_id_and_name_prefix(self) -> None:
+        save = self.spans[1]
+        result = self._get(
+            f"?trace_id={_trace_id(save)}&name_prefix=svc.order.create.save"
+        )
+        self.assertEqual([span["name"] for span in result], ["svc.order.create.save"])
+        result = self._get(f"?trace_id={_trace_id(save)}&name_prefix=svc.user")
+        self.assertEqual(result, [])
+
+    def test_rejects_invalid_limit(self) -> None:
+        self.assertEqual(self._status("/spans?limit=0"), 400)
+        self.assertEqual(self._status("/spans?limit=-1"), 400)
+        self.assertEqual(self._status("/spans?limit=abc"), 400)
+        self.assertEqual(self._status("/other"), 404)
+
+
+class SpanBufferHTTPServerLifecycleTest(unittest.TestCase):
+    def test_stop_without_start_returns(self) -> None:
+        server = SpanBufferHTTPServer(RingBufferSpanExporter(5))
+        server.stop()
+
+    def test_start_is_idempotent_and_stop_releases_port(self) -> None:
+        server = SpanBufferHTTPServer(RingBufferSpanExporter(5))
+        server.start()
+        server.start()
+        host, port = server.address
+        self.assertNotEqual(port, 0)
+        server.stop()
+        server.stop()
+        restarted = SpanBufferHTTPServer(RingBufferSpanExporter(5), host, port)
+        restarted.start()
+        self.addCleanup(restarted.stop)
+        self.assertEqual(restarted.address, (host, port))
+
+
+class OtelTracerSpanBufferTest(unittest.TestCase):
+    def _create_tracer(self, span_buffer_size) -> OtelTracer:
+        return OtelTracer(
+            service_name="test-service",
+            span_exporter=InMemorySpanExporter(),
+            metric_reader=InMemoryMetricReader(),
+            span_buffer_size=span_buffer_size,
+        )
+
+    def test_buffer_is_disabled_by_default(self) -> None:
+        self.assertIsNone(self._create_tracer(None).span_buffer)
+
+    def test_rejects_non_positive_buffer_size(self) -> None:
+        for size in (0, -1):
+            with (
+                self.subTest(size=size),
+                self.assertRaisesRegex(
+                    ValueError, "capacity must be greater than zero"
+                ),
+            ):
+                self._create_tracer(size)
+
+    def test_buffer_receives_finished_spans(self) -> None:
+        tracer = self._create_tracer(2)
+
+        with tracer.start_root_span("svc.order.create"):
+            with tracer.start_span_action("save"):
+                pass
+
+        self.assertEqual(
+            [span.name for span in tracer.span_buffer.get_spans()],
+            ["svc.order.create.save", "svc.order.create"],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+import asyncio
+import gc
+import time
+import unittest
+from unittest import mock
+
+from opentelemetry.sdk.metrics import MeterProvider
+from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+    InMemorySpanExporter,
+)
+
+from microsservice_telemetry_toolkit import OtelTracer
+
+
+class RuntimeMetricsCollectorTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.reader = InMemoryMetricReader()
+        self.tracer = OtelTracer(
+            service_name="test-service",
+            span_exporter=InMemorySpanExporter(),
+            metric_reader=self.reader,
+            runtime_metrics=True,
+        )
+        self.collector = self.tracer.runtime_metrics
+        self.addCleanup(self.tracer.close)
+
+    def _points(self, name: str) -> list:
+        data = self.reader.get_metrics_data()
+        for resource_metrics in data.resource_metrics:
+            for scope_metrics in resource_metrics.scope_metrics:
+                for metric in scope_metrics.metrics:
+                    if metric.name == name:
+                        return list(metric.data.data_points)
+        return []
+
+    def _by_generation(self, name: str) -> dict[int, float]:
+        return {
+            point.attributes["cpython.gc.generation"]: point.value
+            for point in self._points(name)
+        }
+
+    def test_gc_hook_is_added_once_and_removed_on_close(self) -> None:
+        self.collector.register(MeterProvider().get_meter("other"))
+
+        self.assertEqual(gc.callbacks.count(self.collector._on_gc), 1)
+
+        self.tracer.close()
+
+        self.assertNotIn(self.collector._on_gc, gc.callbacks)
+
+    def test_full_collection_increments_both_gc_series(self) -> None:
+        collections_before = self._by_generation("cpython.gc.collections")
+        pause_before = self._by_generation("cpython.gc.pause_time")
+
+        gc.collect()
+
+        collections_after = self._by_generation("cpython.gc.collections")
+        pause_after = self._by_generation("cpython.gc.pause_time")
+        self.assertEqual(collections_after[2], collections_before[2] + 1)
+        self.assertGreater(pause_after[2], pause_before[2])
+
+    def test_repeated_monitor_schedules_a_single_probe(self) -> None:
+        loop = asyncio.new_event_loop()
+        self.addCleanup(loop.close)
+
+        async def monitor_twice() -> None:
+            self.collector.monitor_event_loop(interval=60)
+            self.collector.monitor_event_loop(interval=60)
+            await asyncio.sleep(0)
+
+        with mock.patch.object(
+            self.collector,
+            "_schedule_loop_probe",
+            wraps=self.collector._schedule_loop_probe,
+        ) as schedule:
+            loop.run_until_complete(monitor_twice())
+
+        schedule.assert_called_once_with(loop, 60)
+
+    def test_loop_lag_resets_after_each_collection(self) -> None:
+        self.assertEqual(self._points("python.asyncio.event_loop.lag"), [])
+        loop = asyncio.new_event_loop()
+        self.addCleanup(loop.close)
+
+        async def block_loop() -> None:
+            self.collector.monitor_event_loop(interval=0.01)
+            await asyncio.sleep(0)
+            time.sleep(0.05)
+            await asyncio.sleep(0.02)
+
+        loop.run_until_complete(block_loop())
+
+        first = self._points("python.asyncio.event_loop.lag")
+        second = self._points("python.asyncio.event_loop.lag")
+        self.assertGreater(first[0].value, 0.0)
+        self.assertEqual(second[0].value, 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
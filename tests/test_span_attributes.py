@@ -0,0 +1,60 @@
+import unittest
+
+from opentelemetry.sdk.trace import TracerProvider
+
+from microsservice_telemetry_toolkit import OtelSpan, SpanAttributes
+
+
+class SpanAttributesTest(unittest.TestCase):
+    def test_freezes_sequences_into_tuples(self) -> None:
+        attributes = SpanAttributes.create({"ids": [1, 2], "tags": ("a", "b")})
+
+        self.assertEqual(attributes["ids"], (1, 2))
+        self.assertEqual(attributes["tags"], ("a", "b"))
+
+    def test_copies_input_mapping(self) -> None:
+        source = {"http.route": "/orders"}
+        attributes = SpanAttributes(source)
+        source["http.route"] = "/users"
+        source["extra"] = object()
+
+        self.assertEqual(dict(attributes), {"http.route": "/orders"})
+
+    def test_rejects_invalid_keys(self) -> None:
+        for key in ("", "   ", 1, None):
+            with self.subTest(key=key), self.assertRaises(ValueError):
+                SpanAttributes({key: "value"})
+
+    def test_rejects_invalid_values(self) -> None:
+        for value in (None, {"nested": 1}, [[1, 2]], [1, None], object()):
+            with self.subTest(value=value), self.assertRaises(ValueError):
+                SpanAttributes.create({"key": value})
+
+    def test_merge_overrides_and_keeps_original(self) -> None:
+        base = SpanAttributes.create({"http.route": "/orders", "app.team": "a"})
+
+        merged = base.merge({"app.team": "b", "order.items": [1]})
+
+        self.assertEqual(
+            dict(merged),
+            {"http.route": "/orders", "app.team": "b", "order.items": (1,)},
+        )
+        self.assertEqual(dict(base), {"http.route": "/orders", "app.team": "a"})
+        with self.assertRaises(ValueError):
+            base.merge({"invalid": None})
+
+    def test_set_attributes_on_sdk_span(self) -> None:
+        tracer = TracerProvider().get_tracer("test")
+        sdk_span = tracer.start_span("svc.order.create")
+        attributes = SpanAttributes.create({"http.route": "/orders", "ids": [1, 2]})
+
+        OtelSpan("svc.order.create", sdk_span).set_attributes(attributes)
+        sdk_span.end()
+
+        self.assertEqual(
+            dict(sdk_span.attributes), {"http.route": "/orders", "ids": (1, 2)}
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,195 @@
+import unittest
+from unittest import mock
+
+from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+    InMemorySpanExporter,
+)
+
+from microsservice_telemetry_toolkit import OtelTracer, TelemetryProfiler
+from microsservice_telemetry_toolkit.infrastructure.telemetry_profiler import (
+    _SectionStats,
+    _bucket_index,
+    _bucket_upper_bound,
+)
+
+
+class _TickProfiler(TelemetryProfiler):
+    """Profiler com relógio lógico: registra (seção, início, fim) em ticks."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.tick = 0
+        self.events: list[tuple[str, int, int]] = []
+
+    def start(self) -> int:
+        self.tick += 1
+        return self.tick
+
+    def record(self, section: str, start_ns: int) -> None:
+        self.tick += 1
+        self.events.append((section, start_ns, self.tick))
+
+    def sections(self) -> list[str]:
+        return [section for section, _, _ in self.events]
+
+    def event(self, section: str) -> tuple[str, int, int]:
+        return next(event for event in self.events if event[0] == section)
+
+
+def _create_tracer(profiler=None, metric_reader=None) -> OtelTracer:
+    return OtelTracer(
+        service_name="test-service",
+        span_exporter=InMemorySpanExporter(),
+        metric_reader=metric_reader or InMemoryMetricReader(),
+        profiler=profiler,
+    )
+
+
+class BucketMathTest(unittest.TestCase):
+    def test_buckets_are_contiguous_and_contain_their_values(self) -> None:
+        values = list(range(0, 2000)) + [
+            10**k + d for k in range(4, 15) for d in (-1, 0, 1)
+        ]
+        for value in values:
+            index = _bucket_index(value)
+            lower = _bucket_upper_bound(index - 1) if index > 0 else 0
+            with self.subTest(value=value):
+                self.assertLessEqual(lower, value)
+                self.assertLess(value, _bucket_upper_bound(index))
+
+    def test_bucket_width_is_at_most_25_percent_of_lower_bound(self) -> None:
+        for index in range(4, 64 * 4):
+            lower = _bucket_upper_bound(index - 1)
+            width = _bucket_upper_bound(index) - lower
+            with self.subTest(index=index):
+                self.assertLessEqual(width / lower, 0.25)
+
+    def test_percentiles_stay_within_bucket_error(self) -> None:
+        stats = _SectionStats()
+        for _ in range(99):
+            stats.add(1_000)
+        stats.add(1_000_000)
+
+        self.assertGreaterEqual(stats.percentile_ns(0.50), 1_000)
+        self.assertLessEqual(stats.percentile_ns(0.50), 1_250)
+        self.assertLessEqual(stats.percentile_ns(0.90), 1_250)
+        self.assertEqual(stats.percentile_ns(1.0), 1_000_000)
+
+
+class TelemetryProfilerTest(unittest.TestCase):
+    def _exported(self, reader: InMemoryMetricReader, name: str) -> dict[str, float]:
+        data = reader.get_metrics_data()
+        for resource_metrics in data.resource_metrics:
+            for scope_metrics in resource_metrics.scope_metrics:
+                for metric in scope_metrics.metrics:
+                    if metric.name == name:
+                        return {
+                            point.attributes["section"]: point.value
+                            for point in metric.data.data_points
+                        }
+        return {}
+
+    def test_report_aggregates_per_section(self) -> None:
+        profiler = TelemetryProfiler()
+        for _ in range(3):
+            profiler.record("section.a", profiler.start())
+
+        report = profiler.report()
+
+        self.assertEqual(list(report), ["section.a"])
+        self.assertEqual(report["section.a"]["count"], 3)
+        self.assertIn("section.a", profiler.format_report())
+
+    def test_reset_clears_report_but_exported_counters_stay_monotonic(self) -> None:
+        profiler = TelemetryProfiler()
+        reader = InMemoryMetricReader()
+        tracer = _create_tracer(profiler, reader)
+        for _ in range(3):
+            with tracer.start_root_span("svc.order.create"):
+                pass
+        calls_before = self._exported(reader, "telemetry.toolkit.overhead.calls")
+        time_before = self._exported(reader, "telemetry.toolkit.overhead.time")
+
+        profiler.reset()
+
+        self.assertEqual(profiler.report(), {})
+        calls_after = self._exported(reader, "telemetry.toolkit.overhead.calls")
+        time_after = self._exported(reader, "telemetry.toolkit.overhead.time")
+        self.assertEqual(calls_before["tracer.start_root_span.enter"], 3)
+        self.assertEqual(calls_after, calls_before)
+        self.assertEqual(time_after, time_before)
+
+        with tracer.start_root_span("svc.order.create"):
+            pass
+        calls_next = self._exported(reader, "telemetry.toolkit.overhead.calls")
+        self.assertEqual(calls_next["tracer.start_root_span.enter"], 4)
+        self.assertEqual(profiler.report()["tracer.start_root_span.enter"]["count"], 1)
+
+
+class OtelTracerProfilingTest(unittest.TestCase):
+    def test_enter_is_timed_after_name_validation(self) -> None:
+        profiler = _TickProfiler()
+        tracer = _create_tracer(profiler)
+
+        with tracer.start_root_span("svc.order.create"):
+            with tracer.start_span_action("save"):
+                pass
+
+        validations = [
+            event
+            for event in profiler.events
+            if event[0] == "span_name_validator.validate"
+        ]
+        root_enter = profiler.event("tracer.start_root_span.enter")
+        action_enter = profiler.event("tracer.start_span_action.enter")
+        self.assertEqual(len(validations), 2)
+        self.assertGreater(root_enter[1], validations[0][2])
+        self.assertGreater(action_enter[1], validations[1][2])
+
+    def test_exit_is_recorded_when_body_raises(self) -> None:
+        profiler = _TickProfiler()
+        tracer = _create_tracer(profiler)
+
+        with self.assertRaises(RuntimeError):
+            with tracer.start_root_span("svc.order.create"):
+                with tracer.start_span_action("save"):
+                    raise RuntimeError("boom")
+
+        self.assertIn("tracer.start_span_action.exit", profiler.sections())
+        self.assertIn("tracer.start_root_span.exit", profiler.sections())
+
+    def test_instruments_and_span_attributes_are_timed(self) -> None:
+        profiler = _TickProfiler()
+        tracer = _create_tracer(profiler)
+
+        with tracer.start_root_span("svc.order.create") as span:
+            span.set_attribute("key", "value")
+            span.set_attributes({"a": 1})
+        tracer.create_counter("orders").add(1)
+        tracer.create_histogram("latency").record(1.0)
+
+        for section in (
+            "span.set_attribute",
+            "span.set_attributes",
+            "counter.add",
+            "histogram.record",
+            "exporter.export",
+        ):
+            self.assertIn(section, profiler.sections())
+
+    def test_nothing_is_recorded_without_profiler(self) -> None:
+        tracer = _create_tracer()
+
+        with mock.patch.object(TelemetryProfiler, "record") as record:
+            with tracer.start_root_span("svc.order.create") as span:
+                span.set_attributes({"a": 1})
+                with tracer.start_span_action("save"):
+                    pass
+            tracer.create_counter("orders").add(1)
+
+        record.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()